@@ -1,7 +1,10 @@
 """Authors: Cody Baker."""
 from pathlib import Path
 import numpy as np
-from typing import Union
+from typing import Union, Optional, Iterable
+from itertools import islice
+from queue import Queue, Empty
+from threading import Thread, Event
 
 try:
     import cv2
@@ -10,25 +13,36 @@ try:
 except ImportError:
     HAVE_OPENCV = False
 
+try:
+    import av
+
+    HAVE_PYAV = True
+except ImportError:
+    HAVE_PYAV = False
+
 PathType = Union[str, Path]
 
 
-def get_movie_timestamps(movie_file: PathType):
+def get_movie_timestamps(movie_file: PathType, max_frames: Optional[int] = None):
     """
-    Return numpy array of the timestamps for a movie file.
+    Return numpy array of the timestamps (in seconds) for a movie file.
+
+    Frames are only grabbed, not decoded, since the timestamp is all that is needed. Frames are grabbed until the
+    stream ends rather than up to CAP_PROP_FRAME_COUNT, which is only an estimate for some containers and is missing
+    or invalid for raw streams.
 
     Parameters
     ----------
     movie_file : PathType
+    max_frames : int, optional
+        Stop after this many frames. The default is to read the entire movie.
     """
     cap = cv2.VideoCapture(str(movie_file))
-    timestamps = [cap.get(cv2.CAP_PROP_POS_MSEC)]
-    success, frame = cap.read()
-    while success:
+    timestamps = []
+    while (max_frames is None or len(timestamps) < max_frames) and cap.grab():
         timestamps.append(cap.get(cv2.CAP_PROP_POS_MSEC))
-        success, frame = cap.read()
     cap.release()
-    return np.array(timestamps)
+    return np.array(timestamps, dtype=np.float64) / 1000.0
 
 
 def get_movie_fps(movie_file: PathType):
@@ -52,11 +66,112 @@ def get_frame_shape(movie_file: PathType):
     """
     Return the shape of frames from a movie file.
 
+    The shape is read from the container properties, so no frame needs to be decoded. OpenCV always returns frames
+    converted to three-channel BGR.
+
     Parameters
     ----------
     movie_file : PathType
     """
     cap = cv2.VideoCapture(str(movie_file))
-    success, frame = cap.read()
+    frame_shape = (int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)), int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), 3)
     cap.release()
-    return frame.shape
+    return frame_shape
+
+
+def iter_movie_frames(
+    movie_file: PathType, max_frames: Optional[int] = None, color_mode: str = "bgr", backend: str = "opencv"
+):
+    """
+    Sequentially yield the frames of a movie file as uint8 arrays.
+
+    Parameters
+    ----------
+    movie_file : PathType
+    max_frames : int, optional
+        Stop after this many frames. The default is to read the entire movie.
+    color_mode : str, optional
+        Either "bgr" (the OpenCV default), "rgb", or "gray". The conversion is applied as each frame is decoded;
+        "gray" frames have no channel axis. The default is "bgr".
+    backend : str, optional
+        Either "opencv" or "pyav". PyAV decodes from a single open decoder context, but may not match the frame count
+        and shape that OpenCV reports for the same file. The default is "opencv".
+    """
+    assert color_mode in [
+        "bgr",
+        "rgb",
+        "gray",
+    ], f"Invalid color_mode ({color_mode})! Choose one of 'bgr', 'rgb', or 'gray'."
+    assert backend in ["opencv", "pyav"], f"Invalid backend ({backend})! Choose one of 'opencv' or 'pyav'."
+    if backend == "pyav":
+        assert HAVE_PYAV, "Please install PyAV to decode movies with the 'pyav' backend (pip install av)!"
+        pyav_format = dict(bgr="bgr24", rgb="rgb24", gray="gray")[color_mode]
+        with av.open(str(movie_file)) as container:
+            stream = container.streams.video[0]
+            stream.thread_type = "AUTO"
+            for frame in islice(container.decode(stream), max_frames):
+                yield frame.to_ndarray(format=pyav_format)
+    else:
+        color_conversion = dict(bgr=None, rgb=cv2.COLOR_BGR2RGB, gray=cv2.COLOR_BGR2GRAY)[color_mode]
+        cap = cv2.VideoCapture(str(movie_file))
+        try:
+            n_frames = 0
+            while max_frames is None or n_frames < max_frames:
+                success, frame = cap.read()
+                if not success:
+                    break
+                if color_conversion is not None:
+                    frame = cv2.cvtColor(frame, color_conversion)
+                yield frame
+                n_frames += 1
+        finally:
+            cap.release()
+
+
+def prefetch_frames(frames: Iterable, max_queue_size: int = 4):
+    """
+    Consume an iterable of frames in a background thread, yielding them from a bounded queue.
+
+    This allows the next frames to be decoded while the current ones are being compressed and written.
+
+    Parameters
+    ----------
+    frames : Iterable
+        Typically the generator returned by iter_movie_frames.
+    max_queue_size : int, optional
+        Maximum number of decoded frames held in memory at once. The default is 4.
+    """
+    frame_queue = Queue(maxsize=max_queue_size)
+    stop_event = Event()
+    end_of_frames = object()
+    errors = []
+
+    def decode_frames():
+        try:
+            for frame in frames:
+                if stop_event.is_set():
+                    break
+                frame_queue.put(frame)
+        except Exception as error:
+            errors.append(error)
+        finally:
+            frame_queue.put(end_of_frames)
+
+    decoder = Thread(target=decode_frames, daemon=True)
+    decoder.start()
+    try:
+        while True:
+            frame = frame_queue.get()
+            if frame is end_of_frames:
+                break
+            yield frame
+        if errors:
+            raise errors[0]
+    finally:
+        stop_event.set()
+        while decoder.is_alive():
+            try:
+                frame_queue.get(timeout=0.1)
+            except Empty:
+                pass
+        decoder.join()
@@ -14,15 +14,16 @@ from hdmf.data_utils import DataChunkIterator
 from ....basedatainterface import BaseDataInterface
 from ....utils.conversion_tools import check_regular_timestamps, get_module
 from ....utils.json_schema import get_schema_from_method_signature
-from .movie_utils import get_movie_timestamps, get_movie_fps, get_frame_shape
+from .movie_utils import (
+    HAVE_OPENCV,
+    HAVE_PYAV,
+    get_movie_timestamps,
+    get_movie_fps,
+    get_frame_shape,
+    iter_movie_frames,
+    prefetch_frames,
+)
 
-
-try:
-    import cv2
-
-    HAVE_OPENCV = True
-except ImportError:
-    HAVE_OPENCV = False
 INSTALL_MESSAGE = "Please install opencv to use this extractor (pip install opencv-python)!"
 
 
@@ -56,6 +57,8 @@ class MovieInterface(BaseDataInterface):
         chunk_data: bool = True,
         module_name: Optional[str] = None,
         module_description: Optional[str] = None,
+        color_mode: str = "bgr",
+        backend: str = "opencv",
     ):
         """
         Convert the movie data files to ImageSeries and write them in the NWBFile.
@@ -86,13 +89,27 @@ class MovieInterface(BaseDataInterface):
         module_description: str, optional
             If the processing module specified by module_name does not exist, it will be created with this description.
             The default description is the same as used by the conversion_tools.get_module function.
+        color_mode: str, optional
+            Color layout of the written frames; one of "bgr", "rgb", or "gray". Only used when external_mode=False.
+            The conversion is done as each frame is decoded, and "gray" frames are written without a channel axis,
+            reducing the written bytes by a factor of 3. The default is "bgr", as decoded by OpenCV.
+        backend: str, optional
+            Library used to decode the frames when external_mode=False; either "opencv" or "pyav". Timestamps, frame
+            count and frame shape are always read with OpenCV, which PyAV may not match for every container.
+            The default is "opencv".
         """
+        if color_mode not in ["bgr", "rgb", "gray"]:
+            raise ValueError(f"Invalid color_mode ({color_mode})! Choose one of 'bgr', 'rgb', or 'gray'.")
+        if backend not in ["opencv", "pyav"]:
+            raise ValueError(f"Invalid backend ({backend})! Choose one of 'opencv' or 'pyav'.")
+        if backend == "pyav":
+            assert HAVE_PYAV, "Please install PyAV to decode movies with the 'pyav' backend (pip install av)!"
         file_paths = self.source_data["file_paths"]
 
         if stub_test:
             count_max = 10
         else:
-            count_max = np.inf
+            count_max = None
         if starting_times is not None:
             assert (
                 isinstance(starting_times, list)
@@ -103,7 +120,7 @@ class MovieInterface(BaseDataInterface):
             starting_times = [0.0]
 
         for j, file in enumerate(file_paths):
-            timestamps = starting_times[j] + get_movie_timestamps(movie_file=file)
+            timestamps = starting_times[j] + get_movie_timestamps(movie_file=file, max_frames=count_max)
 
             if len(starting_times) != len(file_paths):
                 starting_times.append(timestamps[-1])
@@ -131,22 +148,26 @@ class MovieInterface(BaseDataInterface):
 
                 total_frames = len(timestamps)
                 frame_shape = get_frame_shape(movie_file=file)
+                if color_mode == "gray":
+                    frame_shape = frame_shape[:2]
                 maxshape = [total_frames]
                 maxshape.extend(frame_shape)
-                best_gzip_chunk = (1, frame_shape[0], frame_shape[1], 3)
+                frame_nbytes = np.prod(frame_shape)  # uint8
+                # chunk several frames together to reach ~1 MB chunks, and write whole chunks (up to ~100 MB of
+                # uncompressed frames) per HDF5 call instead of one frame at a time
+                frames_per_chunk = max(1, min(total_frames, int(1e6 // frame_nbytes)))
+                best_gzip_chunk = (frames_per_chunk, *frame_shape)
+                frames_per_buffer = frames_per_chunk * max(1, int(1e8 // (frames_per_chunk * frame_nbytes)))
                 tqdm_pos, tqdm_mininterval = (0, 10)
                 if chunk_data:
-
-                    def data_generator(file, count_max):
-                        cap = cv2.VideoCapture(str(file))
-                        for _ in range(min(count_max, total_frames)):
-                            success, frame = cap.read()
-                            yield frame
-                        cap.release()
-
+                    frames = prefetch_frames(
+                        frames=iter_movie_frames(
+                            movie_file=file, max_frames=total_frames, color_mode=color_mode, backend=backend
+                        )
+                    )
                     mov = DataChunkIterator(
                         data=tqdm(
-                            iterable=data_generator(file=file, count_max=count_max),
+                            iterable=frames,
                             desc=f"Copying movie data for {Path(file).name}",
                             position=tqdm_pos,
                             total=total_frames,
@@ -154,33 +175,36 @@ class MovieInterface(BaseDataInterface):
                         ),
                         iter_axis=0,  # nwb standard is time as zero axis
                         maxshape=tuple(maxshape),
+                        buffer_size=frames_per_buffer,
                     )
                     image_series_kwargs.update(data=H5DataIO(mov, compression="gzip", chunks=best_gzip_chunk))
                 else:
-                    cap = cv2.VideoCapture(str(file))
-                    mov = []
+                    mov = np.empty(shape=(total_frames, *frame_shape), dtype="uint8")
+                    n_frames = 0
                     with tqdm(
                         desc=f"Reading movie data for {Path(file).name}",
                         position=tqdm_pos,
                         total=total_frames,
                         mininterval=tqdm_mininterval,
                     ) as pbar:
-                        for _ in range(min(count_max, total_frames)):
-                            success, frame = cap.read()
-                            mov.append(frame)
+                        for frame in iter_movie_frames(
+                            movie_file=file, max_frames=total_frames, color_mode=color_mode, backend=backend
+                        ):
+                            mov[n_frames] = frame
+                            n_frames += 1
                             pbar.update(1)
-                    cap.release()
                     image_series_kwargs.update(
                         data=H5DataIO(
                             DataChunkIterator(
                                 tqdm(
-                                    iterable=np.array(mov),
+                                    iterable=mov[:n_frames],
                                     desc=f"Writing movie data for {Path(file).name}",
                                     position=tqdm_pos,
                                     mininterval=tqdm_mininterval,
                                 ),
                                 iter_axis=0,  # nwb standard is time as zero axis
                                 maxshape=tuple(maxshape),
+                                buffer_size=frames_per_buffer,
                             ),
                             compression="gzip",
                             chunks=best_gzip_chunk,
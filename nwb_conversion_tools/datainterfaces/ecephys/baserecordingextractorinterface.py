@@ -156,6 +156,8 @@ class BaseRecordingExtractorInterface(BaseDataInterface, ABC):
                     Recommended to be as much free RAM as available). Automatically calculates suitable buffer shape.
                 chunk_mb : float (optional, defaults to 1 MB)
                     Should be below 1 MB. Automatically calculates suitable chunk shape.
+                prefetch : bool (optional, defaults to False)
+                    Read the next chunk in a background thread while the current one is written.
             If manual specification of buffer_shape and chunk_shape are desired, these may be specified as well.
         """
         if stub_test or self.subset_channels is not None:
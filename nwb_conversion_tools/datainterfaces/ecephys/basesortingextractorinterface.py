@@ -83,14 +83,11 @@ class BaseSortingExtractorInterface(BaseDataInterface, ABC):
             add_electrodes(recording=recording, nwbfile=nwbfile, metadata=metadata)
 
         if stub_test:
-            max_min_spike_time = max(
-                [
-                    min(x)
-                    for y in self.sorting_extractor.get_unit_ids()
-                    for x in [self.sorting_extractor.get_unit_spike_train(y)]
-                    if any(x)
-                ]
+            spike_trains = (
+                self.sorting_extractor.get_unit_spike_train(unit_id=unit_id)
+                for unit_id in self.sorting_extractor.get_unit_ids()
             )
+            max_min_spike_time = max(np.min(spike_train) for spike_train in spike_trains if np.any(spike_train))
             stub_sorting_extractor = se.SubSortingExtractor(
                 self.sorting_extractor,
                 unit_ids=self.sorting_extractor.get_unit_ids(),
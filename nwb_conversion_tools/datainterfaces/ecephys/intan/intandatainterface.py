@@ -1,4 +1,5 @@
 """Authors: Cody Baker and Ben Dichter."""
+import re
 from pathlib import Path
 
 import spikeextractors as se
@@ -14,6 +15,7 @@ try:
 except ImportError:
     HAVE_PYINTAN = False
 INSTALL_MESSAGE = "Please install pyintan to use this extractor!"
+EXCLUDED_CHANNEL_TYPES = re.compile("AUX|ADC|VDD")
 
 
 class IntanRecordingInterface(BaseRecordingExtractorInterface):
@@ -28,14 +30,24 @@ class IntanRecordingInterface(BaseRecordingExtractorInterface):
             intan_file_metadata = read_rhd(self.source_data["file_path"])[1]
         else:
             intan_file_metadata = read_rhs(self.source_data["file_path"])[1]
-        exclude_chan_types = ["AUX", "ADC", "VDD"]
-        valid_channels = [
-            x for x in intan_file_metadata if not any([y in x["native_channel_name"] for y in exclude_chan_types])
-        ]
-
-        group_names = [channel["native_channel_name"].split("-")[0] for channel in valid_channels]
+        group_names = []
+        group_electrode_numbers = []
+        custom_names = []
+        has_custom_names = False
+        for channel in intan_file_metadata:
+            native_channel_name = channel["native_channel_name"]
+            if EXCLUDED_CHANNEL_TYPES.search(native_channel_name):
+                continue
+            group_names.append(native_channel_name.partition("-")[0])
+            group_electrode_numbers.append(channel["native_order"])
+            custom_name = channel["custom_channel_name"]
+            custom_names.append(custom_name)
+            has_custom_names = has_custom_names or bool(custom_name)
         unique_group_names = set(group_names)
-        group_electrode_numbers = [channel["native_order"] for channel in valid_channels]
+        # Recorded here so get_metadata does not have to re-scan the per-channel properties
+        self._channel_group_names = [f"Group{channel_group}" for channel_group in sorted(unique_group_names)]
+        self._has_group_electrode_numbers = len(unique_group_names) > 1
+        self._has_custom_names = has_custom_names
 
         channel_ids = self.recording_extractor.get_channel_ids()
         for channel_id, channel_group in zip(channel_ids, group_names):
@@ -43,14 +55,13 @@ class IntanRecordingInterface(BaseRecordingExtractorInterface):
                 channel_id=channel_id, property_name="group_name", value=f"Group{channel_group}"
             )
 
-        if len(unique_group_names) > 1:
+        if self._has_group_electrode_numbers:
             for channel_id, group_electrode_number in zip(channel_ids, group_electrode_numbers):
                 self.recording_extractor.set_channel_property(
                     channel_id=channel_id, property_name="group_electrode_number", value=group_electrode_number
                 )
 
-        custom_names = [channel["custom_channel_name"] for channel in valid_channels]
-        if any(custom_names):
+        if self._has_custom_names:
             for channel_id, custom_name in zip(channel_ids, custom_names):
                 self.recording_extractor.set_channel_property(
                     channel_id=channel_id, property_name="custom_channel_name", value=custom_name
@@ -64,8 +75,6 @@ class IntanRecordingInterface(BaseRecordingExtractorInterface):
         return metadata_schema
 
     def get_metadata(self):
-        channel_ids = self.recording_extractor.get_channel_ids()
-        property_names = self.recording_extractor.get_shared_channel_property_names()
         ecephys_metadata = dict(
             Ecephys=dict(
                 Device=[
@@ -82,14 +91,7 @@ class IntanRecordingInterface(BaseRecordingExtractorInterface):
                         device="Intan",
                         location="",
                     )
-                    for group_name in set(
-                        [
-                            self.recording_extractor.get_channel_property(
-                                channel_id=channel_id, property_name="group_name"
-                            )
-                            for channel_id in channel_ids
-                        ]
-                    )
+                    for group_name in self._channel_group_names
                 ],
                 Electrodes=[
                     dict(name="group_name", description="The name of the ElectrodeGroup this electrode is a part of.")
@@ -97,11 +99,11 @@ class IntanRecordingInterface(BaseRecordingExtractorInterface):
                 ElectricalSeries_raw=dict(name="ElectricalSeries_raw", description="Raw acquisition traces."),
             )
         )
-        if "group_electrode_number" in property_names:
+        if self._has_group_electrode_numbers:
             ecephys_metadata["Ecephys"]["Electrodes"].append(
                 dict(name="group_electrode_number", description="0-indexed channel within a group.")
             )
-        if "custom_channel_name" in property_names:
+        if self._has_custom_names:
             ecephys_metadata["Ecephys"]["Electrodes"].append(
                 dict(name="custom_channel_name", description="Custom channel name assigned in Intan.")
             )
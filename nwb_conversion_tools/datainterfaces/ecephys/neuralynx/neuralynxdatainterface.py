@@ -1,5 +1,6 @@
 """Authors: Cody Baker."""
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from natsort import natsorted
 
 from spikeextractors import MultiRecordingChannelExtractor, NeuralynxRecordingExtractor
@@ -17,7 +18,13 @@ class NeuralynxRecordingInterface(BaseRecordingExtractorInterface):
         self.subset_channels = None
         self.source_data = dict(folder_path=folder_path)
         neuralynx_files = natsorted([str(x) for x in Path(folder_path).iterdir() if ".ncs" in x.suffixes])
-        extractors = [NeuralynxRecordingExtractor(filename=filename, seg_index=0) for filename in neuralynx_files]
+        # each extractor parses its own .ncs header, so the file reads can overlap
+        with ThreadPoolExecutor() as executor:
+            extractors = list(
+                executor.map(
+                    lambda filename: NeuralynxRecordingExtractor(filename=filename, seg_index=0), neuralynx_files
+                )
+            )
         gains = [extractor.get_channel_gains()[0] for extractor in extractors]
         for extractor in extractors:
             extractor.clear_channel_gains()
@@ -1,6 +1,8 @@
 """Authors: Cody Baker and Ben Dichter."""
 from pathlib import Path
 from typing import Optional, List
+from functools import lru_cache
+from itertools import chain
 
 import numpy as np
 import spikeextractors as se
@@ -35,6 +37,12 @@ def get_xml(xml_file_path: str):
     return et.parse(xml_file_path).getroot()
 
 
+@lru_cache(maxsize=16)
+def _get_cached_xml(xml_file_path: str, mtime_ns: int):
+    """Parse the xml once per file version; the returned root is shared, so callers must only read from it."""
+    return get_xml(xml_file_path)
+
+
 def get_shank_channels(xml_file_path: str, sort: bool = False):
     """
     Auxiliary function for retrieving the list of structured shank-only channels.
@@ -42,7 +50,7 @@ def get_shank_channels(xml_file_path: str, sort: bool = False):
     Attempts to retrieve these first from the spikeDetection sub-field in the event that spike sorting was performed on
     the raw data. In the event that spike sorting was not performed, it then retrieves only the anatomicalDescription.
     """
-    root = get_xml(xml_file_path)
+    root = _get_cached_xml(xml_file_path, mtime_ns=Path(xml_file_path).stat().st_mtime_ns)
     try:
         shank_channels = [
             [int(channel.text) for channel in group.find("channels")]
@@ -84,10 +92,12 @@ class NeuroscopeRecordingInterface(BaseRecordingExtractorInterface):
     def __init__(self, file_path: FilePathType):
         super().__init__(file_path=file_path)
         xml_file_path = get_xml_file_path(data_file_path=self.source_data["file_path"])
-        self.subset_channels = get_shank_channels(xml_file_path=xml_file_path, sort=True)
         shank_channels = get_shank_channels(xml_file_path)
-        group_electrode_numbers = [x for channels in shank_channels for x, _ in enumerate(channels)]
-        group_names = [f"shank{n + 1}" for n, channels in enumerate(shank_channels) for _ in channels]
+        self.subset_channels = sorted(chain.from_iterable(shank_channels))
+        group_electrode_numbers = chain.from_iterable(range(len(channels)) for channels in shank_channels)
+        group_names = chain.from_iterable(
+            [f"shank{n + 1}"] * len(channels) for n, channels in enumerate(shank_channels)
+        )
         for channel_id, group_electrode_number, group_name in zip(
             self.recording_extractor.get_channel_ids(), group_electrode_numbers, group_names
         ):
@@ -127,10 +137,12 @@ class NeuroscopeMultiRecordingTimeInterface(BaseRecordingExtractorInterface):
     def __init__(self, folder_path: FolderPathType):
         super().__init__(folder_path=folder_path)
         xml_file_path = get_xml_file_path(data_file_path=self.source_data["folder_path"])
-        self.subset_channels = get_shank_channels(xml_file_path=xml_file_path, sort=True)
         shank_channels = get_shank_channels(xml_file_path)
-        group_electrode_numbers = [x for channels in shank_channels for x, _ in enumerate(channels)]
-        group_names = [f"shank{n + 1}" for n, channels in enumerate(shank_channels) for _ in channels]
+        self.subset_channels = sorted(chain.from_iterable(shank_channels))
+        group_electrode_numbers = chain.from_iterable(range(len(channels)) for channels in shank_channels)
+        group_names = chain.from_iterable(
+            [f"shank{n + 1}"] * len(channels) for n, channels in enumerate(shank_channels)
+        )
         for channel_id, group_electrode_number, group_name in zip(
             self.recording_extractor.get_channel_ids(), group_electrode_numbers, group_names
         ):
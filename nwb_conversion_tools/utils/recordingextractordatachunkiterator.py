@@ -1,6 +1,9 @@
 """Authors: Cody Baker and Saksham Sharda."""
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple, Iterable
 
+import numpy as np
+from hdmf.data_utils import DataChunk
 from spikeextractors import RecordingExtractor
 
 from .genericdatachunkiterator import GenericDataChunkIterator
@@ -16,18 +19,66 @@ class RecordingExtractorDataChunkIterator(GenericDataChunkIterator):
         buffer_shape: tuple = None,
         chunk_mb: float = None,
         chunk_shape: tuple = None,
+        prefetch: bool = False,
     ):
+        """
+        Initialize the iterator over the traces of a RecordingExtractor.
+
+        See GenericDataChunkIterator for the buffer and chunk shape arguments.
+
+        prefetch : bool, optional
+            If True, the traces of the next chunk are read in a background thread while the current chunk is being
+            compressed and written. At most one chunk is read ahead. Defaults to False.
+        """
         self.recording = recording
         self.channel_ids = recording.get_channel_ids()
+        self.prefetch = prefetch
+        self._executor = None
+        self._pending = None
         super().__init__(buffer_gb=buffer_gb, buffer_shape=buffer_shape, chunk_mb=chunk_mb, chunk_shape=chunk_shape)
 
+    def _submit_next_chunk(self):
+        """Start reading the next chunk in the background; return its (selection, future), or None when exhausted."""
+        chunk_idx = next(self.chunk_idx_generator, None)
+        if chunk_idx is None:
+            return None
+        selection = self._chunk_map(chunk_idx=chunk_idx)
+        return selection, self._executor.submit(self._get_data, selection)
+
+    def __next__(self) -> DataChunk:
+        if not self.prefetch:
+            return super().__next__()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+            self._pending = self._submit_next_chunk()
+        if self._pending is None:
+            self._executor.shutdown()
+            raise StopIteration
+        selection, future = self._pending
+        try:
+            data = future.result()
+        except Exception:
+            # a failed read ends the iteration, so release the worker thread instead of leaving it to the interpreter
+            self._pending = None
+            self._executor.shutdown()
+            raise
+        self._pending = self._submit_next_chunk()
+        return DataChunk(data=data, selection=selection)
+
     def _get_data(self, selection: Tuple[slice]) -> Iterable:
-        return self.recording.get_traces(
-            channel_ids=self.channel_ids[selection[1]],
+        channel_selection = selection[1]
+        if channel_selection.start == 0 and channel_selection.stop == len(self.channel_ids):
+            channel_ids = None  # let the extractor take its own all-channel path
+        else:
+            channel_ids = self.channel_ids[channel_selection]
+        traces = self.recording.get_traces(
+            channel_ids=channel_ids,
             start_frame=selection[0].start,
             end_frame=selection[0].stop,
             return_scaled=False,
-        ).T
+        )
+        # get_traces returns (channels, frames); copy the transpose once so h5py receives a C-contiguous block
+        return np.ascontiguousarray(traces.T)
 
     def _get_dtype(self):
         return self.recording.get_dtype(return_scaled=False)
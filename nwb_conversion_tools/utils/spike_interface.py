@@ -1,8 +1,8 @@
+import re
 import uuid
 from datetime import datetime
 import warnings
 import numpy as np
-import distutils.version
 from pathlib import Path
 from typing import Optional, List
 from warnings import warn
@@ -17,6 +17,9 @@ from .json_schema import dict_deep_update, OptionalFilePathType, ArrayType
 
 from .recordingextractordatachunkiterator import RecordingExtractorDataChunkIterator
 
+# Parsed once at import; distutils is deprecated and LooseVersion was otherwise rebuilt on every call
+_PYNWB_VERSION = tuple(int(x) for x in re.findall(r"\d+", pynwb.__version__)[:3])
+
 
 def list_get(li: list, idx: int, default):
     """Safe index retrieval from list."""
@@ -305,7 +308,7 @@ def add_electrodes(recording: se.RecordingExtractor, nwbfile=None, metadata: dic
     if nwbfile.electrode_groups is None or len(nwbfile.electrode_groups) == 0:
         add_electrode_groups(recording, nwbfile, metadata)
     # For older versions of pynwb, we need to manually add these columns
-    if distutils.version.LooseVersion(pynwb.__version__) < "1.3.0":
+    if _PYNWB_VERSION < (1, 3, 0):
         if nwbfile.electrodes is None or "rel_x" not in nwbfile.electrodes.colnames:
             nwbfile.add_electrode_column("rel_x", "x position of electrode in electrode group")
         if nwbfile.electrodes is None or "rel_y" not in nwbfile.electrodes.colnames:
@@ -347,7 +350,7 @@ def add_electrodes(recording: se.RecordingExtractor, nwbfile=None, metadata: dic
     if nwbfile.electrodes is None:
         nwb_elec_ids = []
     else:
-        nwb_elec_ids = nwbfile.electrodes.id.data[:]
+        nwb_elec_ids = set(nwbfile.electrodes.id.data[:])
 
     elec_columns = defaultdict(dict)  # dict(name: dict(description='',data=data, index=False))
     elec_columns_append = defaultdict(dict)
@@ -429,13 +432,20 @@ def add_electrodes(recording: se.RecordingExtractor, nwbfile=None, metadata: dic
     for name in elec_columns_append:
         _ = elec_columns.pop(name)
 
-    for j, channel_id in enumerate(recording.get_channel_ids()):
+    # ids are already checked against the table above, so skip the per-row scan pynwb>=2.0 does by default
+    unique_id_kwargs = dict(enforce_unique_id=False) if _PYNWB_VERSION >= (2, 0, 0) else dict()
+    channel_ids = recording.get_channel_ids()
+    # recording.get_channel_locations defaults to np.nan if there are none
+    channel_locations = recording.get_channel_locations(channel_ids=channel_ids)
+    # only read groups when they are used, since get_channel_groups stores default groups on the recording
+    if "group_name" not in elec_columns:
+        channel_groups = recording.get_channel_groups(channel_ids=channel_ids)
+    for j, channel_id in enumerate(channel_ids):
         if channel_id not in nwb_elec_ids:
             electrode_kwargs = dict(default_updated)
             electrode_kwargs.update(id=channel_id)
 
-            # recording.get_channel_locations defaults to np.nan if there are none
-            location = recording.get_channel_locations(channel_ids=channel_id)[0]
+            location = channel_locations[j]
             if all([not np.isnan(loc) for loc in location]):
                 # property 'location' of RX channels corresponds to rel_x and rel_ y of NWB electrodes
                 electrode_kwargs.update(dict(rel_x=float(location[0]), rel_y=float(location[1])))
@@ -463,10 +473,10 @@ def add_electrodes(recording: se.RecordingExtractor, nwbfile=None, metadata: dic
                     electrode_kwargs[name] = desc["data"][j]
 
             if "group_name" not in elec_columns:
-                group_id = recording.get_channel_groups(channel_ids=channel_id)[0]
+                group_id = channel_groups[j]
                 electrode_kwargs.update(dict(group=nwbfile.electrode_groups[str(group_id)], group_name=str(group_id)))
 
-            nwbfile.add_electrode(**electrode_kwargs)
+            nwbfile.add_electrode(**electrode_kwargs, **unique_id_kwargs)
     # add columns for existing electrodes:
     for col_name, cols_args in elec_columns_append.items():
         nwbfile.add_electrode_column(col_name, **cols_args)
@@ -533,6 +543,8 @@ def add_electrical_series(
                 Recommended to be as much free RAM as available. Automatically calculates suitable buffer shape.
             chunk_mb: float (optional, defaults to 1 MB)
                 Should be below 1 MB. Automatically calculates suitable chunk shape.
+            prefetch: bool (optional, defaults to False)
+                Read the next chunk in a background thread while the current one is written.
         If manual specification of buffer_shape and chunk_shape are desired, these may be specified as well.
 
     Missing keys in an element of metadata['Ecephys']['ElectrodeGroup'] will be auto-populated with defaults
@@ -784,6 +796,8 @@ def add_all_to_nwbfile(
                 Recommended to be as much free RAM as available). Automatically calculates suitable buffer shape.
             chunk_mb : float (optional, defaults to 1 MB, only available for 'v2')
                 Should be below 1 MB. Automatically calculates suitable chunk shape.
+            prefetch : bool (optional, defaults to False)
+                Read the next chunk in a background thread while the current one is written.
         If manual specification of buffer_shape and chunk_shape are desired, these may be specified as well.
     """
     if nwbfile is not None:
@@ -908,13 +922,15 @@ def write_recording(
                 Recommended to be as much free RAM as available). Automatically calculates suitable buffer shape.
             chunk_mb : float (optional, defaults to 1 MB)
                 Should be below 1 MB. Automatically calculates suitable chunk shape.
+            prefetch : bool (optional, defaults to False)
+                Read the next chunk in a background thread while the current one is written.
         If manual specification of buffer_shape and chunk_shape are desired, these may be specified as well.
     """
     if nwbfile is not None:
         assert isinstance(nwbfile, pynwb.NWBFile), "'nwbfile' should be of type pynwb.NWBFile"
 
     assert (
-        distutils.version.LooseVersion(pynwb.__version__) >= "1.3.3"
+        _PYNWB_VERSION >= (1, 3, 3)
     ), "'write_recording' not supported for version < 1.3.3. Run pip install --upgrade pynwb"
 
     assert save_path is None or nwbfile is None, "Either pass a save_path location, or nwbfile object, but not both!"
@@ -1121,8 +1137,9 @@ def write_units(
             spkt = sorting.frame_to_time(sorting.get_unit_spike_train(unit_id=unit_id))
         else:
             spkt = sorting.get_unit_spike_train(unit_id=unit_id) / sorting.get_sampling_frequency()
+        unit_property_names = sorting.get_unit_property_names(unit_id)
         for pr in write_properties:
-            if pr in sorting.get_unit_property_names(unit_id):
+            if pr in unit_property_names:
                 prop_value = sorting.get_unit_property(unit_id, pr)
                 unit_kwargs.update({pr: prop_value})
             else:  # Case of missing data for this unit and this property
@@ -1 +1,36 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from spikeextractors import NumpyRecordingExtractor
+
 from nwb_conversion_tools.utils.recordingextractordatachunkiterator import RecordingExtractorDataChunkIterator
+
+
+class TestRecordingExtractorDataChunkIterator(unittest.TestCase):
+    def setUp(self):
+        self.traces = np.random.default_rng(seed=0).integers(-1000, 1000, (8, 10000), dtype=np.int16)
+        self.recording = NumpyRecordingExtractor(timeseries=self.traces, sampling_frequency=30000.0)
+
+    def test_prefetch_matches_sequential_chunks(self):
+        # 3 does not divide the 8 channels, so channel subsets and a partial last chunk are included
+        chunk_shape = (1000, 3)
+        sequential_chunks = list(RecordingExtractorDataChunkIterator(recording=self.recording, chunk_shape=chunk_shape))
+        prefetched_chunks = list(
+            RecordingExtractorDataChunkIterator(recording=self.recording, chunk_shape=chunk_shape, prefetch=True)
+        )
+        self.assertEqual(len(sequential_chunks), 10 * 3)
+        self.assertEqual(len(prefetched_chunks), len(sequential_chunks))
+        for sequential_chunk, prefetched_chunk in zip(sequential_chunks, prefetched_chunks):
+            self.assertEqual(sequential_chunk.selection, prefetched_chunk.selection)
+            np.testing.assert_array_equal(sequential_chunk.data, prefetched_chunk.data)
+            np.testing.assert_array_equal(prefetched_chunk.data, self.traces.T[prefetched_chunk.selection])
+
+    def test_prefetch_read_error(self):
+        iterator = RecordingExtractorDataChunkIterator(recording=self.recording, chunk_shape=(1000, 8), prefetch=True)
+        with patch.object(self.recording, "get_traces", side_effect=OSError("Simulated read error.")):
+            with self.assertRaises(OSError):
+                next(iterator)
+        self.assertTrue(iterator._executor._shutdown)
+        with self.assertRaises(StopIteration):
+            next(iterator)
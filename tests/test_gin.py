@@ -1,3 +1,4 @@
+import shutil
 import sys
 import tempfile
 import unittest
@@ -44,6 +45,8 @@ if HAVE_PARAMETERIZED and (HAVE_DATALAD and sys.platform == "linux" or RUN_LOCAL
             f"{parameterized.to_safe_name(param.kwargs['recording_interface'].__name__)}"
         )
 
+    # All cases install and read the same datalad dataset, so this module must not be split across pytest-xdist
+    # workers; CI runs with --dist loadfile for that reason.
     class TestNwbConversions(unittest.TestCase):
         dataset = None
         savedir = Path(tempfile.mkdtemp())
@@ -113,6 +116,10 @@ if HAVE_PARAMETERIZED and (HAVE_DATALAD and sys.platform == "linux" or RUN_LOCAL
             elif not data_exists:
                 self.dataset = install("https://gin.g-node.org/NeuralEnsemble/ephy_testing_data")
 
+        @classmethod
+        def tearDownClass(cls):
+            shutil.rmtree(cls.savedir, ignore_errors=True)
+
         @parameterized.expand(
             [
                 (
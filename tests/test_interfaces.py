@@ -1,12 +1,12 @@
 from jsonschema import Draft7Validator
 import numpy as np
 from tempfile import mkdtemp
-from shutil import rmtree
 from pathlib import Path
 from itertools import product
 
 import pytest
 import spikeextractors as se
+from pynwb import NWBHDF5IO
 from spikeextractors.testing import check_recordings_equal, check_sortings_equal
 
 try:
@@ -25,18 +25,67 @@ from nwb_conversion_tools import (
     SIPickleSortingExtractorInterface,
     interface_list,
 )
+from nwb_conversion_tools.datainterfaces.behavior.movie import movie_utils
+
+# Compiled once and shared by the schema tests, rather than rebuilt by every check_schema call
+META_SCHEMA_VALIDATOR = Draft7Validator(Draft7Validator.META_SCHEMA)
+
+
+@pytest.fixture(params=["opencv", "pyav"])
+def movie_backend(request):
+    """Run a movie test once per decoding backend of MovieInterface."""
+    if request.param == "pyav" and not movie_utils.HAVE_PYAV:
+        pytest.skip("PyAV is not installed!")
+    return request.param
+
+
+def write_test_movie(movie_file: Path, n_frames: int, frame_size: tuple):
+    """Encode random frames as MJPG, generating all of them in a single buffer."""
+    (nx, ny) = frame_size
+    writer = cv2.VideoWriter(
+        filename=str(movie_file),
+        apiPreference=None,
+        fourcc=cv2.VideoWriter_fourcc("M", "J", "P", "G"),
+        fps=25,
+        frameSize=(ny, nx),
+        params=None,
+    )
+    frames = np.random.default_rng(seed=0).integers(0, 256, (n_frames, nx, ny, 3), dtype=np.uint8)
+    for frame in frames:
+        writer.write(frame)
+    writer.release()
+
+
+@pytest.fixture(scope="session")
+def movie_file(tmp_path_factory):
+    """AVI of 50 frames of 640 x 480, encoded once per session since the movie tests only read it."""
+    if not HAVE_OPENCV:
+        pytest.skip("OpenCV is not installed!")
+    movie_file = tmp_path_factory.mktemp("movie") / "test1.avi"
+    write_test_movie(movie_file=movie_file, n_frames=50, frame_size=(640, 480))
+    return movie_file
+
+
+@pytest.fixture(scope="session")
+def raw_movie_file(tmp_path_factory):
+    """Raw MJPEG stream of 50 frames; it has no container-level frame count, so CAP_PROP_FRAME_COUNT is not usable."""
+    if not HAVE_OPENCV:
+        pytest.skip("OpenCV is not installed!")
+    movie_file = tmp_path_factory.mktemp("raw_movie") / "test1.mjpeg"
+    write_test_movie(movie_file=movie_file, n_frames=50, frame_size=(48, 64))
+    return movie_file
 
 
 @pytest.mark.parametrize("data_interface", interface_list)
 def test_interface_source_schema(data_interface):
     schema = data_interface.get_source_schema()
-    Draft7Validator.check_schema(schema)
+    META_SCHEMA_VALIDATOR.validate(schema)
 
 
 @pytest.mark.parametrize("data_interface", interface_list)
 def test_interface_conversion_options_schema(data_interface):
     schema = data_interface.get_conversion_options_schema()
-    Draft7Validator.check_schema(schema)
+    META_SCHEMA_VALIDATOR.validate(schema)
 
 
 def test_tutorials():
@@ -115,67 +164,112 @@ def test_pkl_interface():
     check_sortings_equal(SX1=toy_data[1], SX2=nwb_sorting)
 
 
-def test_movie_interface():
-    if HAVE_OPENCV:
-        test_dir = Path(mkdtemp())
-        movie_file = test_dir / "test1.avi"
-        nwbfile_path = str(test_dir / "test1.nwb")
-        (nf, nx, ny) = (50, 640, 480)
-        writer = cv2.VideoWriter(
-            filename=str(movie_file),
-            apiPreference=None,
-            fourcc=cv2.VideoWriter_fourcc("M", "J", "P", "G"),
-            fps=25,
-            frameSize=(ny, nx),
-            params=None,
-        )
-        for k in range(nf):
-            writer.write(np.random.randint(0, 255, (nx, ny, 3)).astype("uint8"))
-        writer.release()
+def test_movie_interface(tmp_path, movie_file, movie_backend):
+    nwbfile_path = str(tmp_path / "test1.nwb")
+    (nf, nx, ny) = (50, 640, 480)
 
-        class MovieTestNWBConverter(NWBConverter):
-            data_interface_classes = dict(Movie=MovieInterface)
+    class MovieTestNWBConverter(NWBConverter):
+        data_interface_classes = dict(Movie=MovieInterface)
 
-        source_data = dict(Movie=dict(file_paths=[movie_file]))
-        converter = MovieTestNWBConverter(source_data)
-        metadata = converter.get_metadata()
+    source_data = dict(Movie=dict(file_paths=[movie_file]))
+    converter = MovieTestNWBConverter(source_data)
+    metadata = converter.get_metadata()
 
-        # Default usage
-        converter.run_conversion(metadata=metadata, nwbfile_path=nwbfile_path, overwrite=True)
+    # Default usage
+    converter.run_conversion(metadata=metadata, nwbfile_path=nwbfile_path, overwrite=True)
 
-        # This conversion option operates independently of all others
+    # This conversion option operates independently of all others
+    converter.run_conversion(
+        metadata=metadata,
+        nwbfile_path=nwbfile_path,
+        overwrite=True,
+        conversion_options=dict(Movie=dict(starting_times=[123.0])),
+    )
+
+    # These conversion options do not operate independently, so test them jointly
+    conversion_options_testing_matrix = [
+        dict(Movie=dict(external_mode=False, stub_test=x, chunk_data=y, backend=movie_backend))
+        for x, y in product([True, False], repeat=2)
+    ]
+    for conversion_options in conversion_options_testing_matrix:
         converter.run_conversion(
-            metadata=metadata,
-            nwbfile_path=nwbfile_path,
-            overwrite=True,
-            conversion_options=dict(Movie=dict(starting_times=[123.0])),
+            metadata=metadata, nwbfile_path=nwbfile_path, overwrite=True, conversion_options=conversion_options
         )
 
-        # These conversion options do not operate independently, so test them jointly
-        conversion_options_testing_matrix = [
-            dict(Movie=dict(external_mode=False, stub_test=x, chunk_data=y))
-            for x, y in product([True, False], repeat=2)
-        ]
-        for conversion_options in conversion_options_testing_matrix:
+    for chunk_data in [True, False]:
+        written_frames = dict()
+        for color_mode in ["bgr", "rgb", "gray"]:
             converter.run_conversion(
-                metadata=metadata, nwbfile_path=nwbfile_path, overwrite=True, conversion_options=conversion_options
+                metadata=metadata,
+                nwbfile_path=nwbfile_path,
+                overwrite=True,
+                conversion_options=dict(
+                    Movie=dict(
+                        external_mode=False, chunk_data=chunk_data, color_mode=color_mode, backend=movie_backend
+                    )
+                ),
             )
+            with NWBHDF5IO(path=nwbfile_path, mode="r") as io:
+                nwbfile = io.read()
+                written_frames[color_mode] = nwbfile.acquisition[f"Video: {Path(movie_file).stem}"].data[:]
+        assert written_frames["gray"].shape == (nf, nx, ny)
+        np.testing.assert_array_equal(written_frames["rgb"][..., ::-1], written_frames["bgr"])
+        expected_gray = np.array([cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) for frame in written_frames["bgr"]])
+        if movie_backend == "opencv":
+            np.testing.assert_array_equal(written_frames["gray"], expected_gray)
+        else:
+            # PyAV returns the decoded luma plane, which only approximately matches the luma of its BGR frames
+            assert np.abs(written_frames["gray"].astype(int) - expected_gray).mean() < 2
 
-        module_name = "TestModule"
-        module_description = "This is a test module."
-        nwbfile = converter.run_conversion(metadata=metadata, save_to_file=False)
-        assert f"Video: {Path(movie_file).stem}" in nwbfile.acquisition
-        nwbfile = converter.run_conversion(
+    with pytest.raises(ValueError):
+        converter.run_conversion(
             metadata=metadata,
             save_to_file=False,
-            nwbfile=nwbfile,
-            conversion_options=dict(Movie=dict(module_name=module_name)),
+            conversion_options=dict(Movie=dict(external_mode=False, color_mode="hsv")),
         )
-        assert module_name in nwbfile.modules
-        nwbfile = converter.run_conversion(
+
+    module_name = "TestModule"
+    module_description = "This is a test module."
+    nwbfile = converter.run_conversion(metadata=metadata, save_to_file=False)
+    assert f"Video: {Path(movie_file).stem}" in nwbfile.acquisition
+    nwbfile = converter.run_conversion(
+        metadata=metadata,
+        save_to_file=False,
+        nwbfile=nwbfile,
+        conversion_options=dict(Movie=dict(module_name=module_name)),
+    )
+    assert module_name in nwbfile.modules
+    nwbfile = converter.run_conversion(
+        metadata=metadata,
+        save_to_file=False,
+        conversion_options=dict(Movie=dict(module_name=module_name, module_description=module_description)),
+    )
+    assert module_name in nwbfile.modules and nwbfile.modules[module_name].description == module_description
+
+
+def test_movie_interface_without_frame_count(tmp_path, raw_movie_file, movie_backend):
+    movie_file = raw_movie_file
+    nwbfile_path = str(tmp_path / "test1.nwb")
+    (nf, nx, ny) = (50, 48, 64)
+
+    assert len(movie_utils.get_movie_timestamps(movie_file=movie_file)) == nf
+    assert len(movie_utils.get_movie_timestamps(movie_file=movie_file, max_frames=10)) == 10
+
+    class MovieTestNWBConverter(NWBConverter):
+        data_interface_classes = dict(Movie=MovieInterface)
+
+    converter = MovieTestNWBConverter(source_data=dict(Movie=dict(file_paths=[movie_file])))
+    metadata = converter.get_metadata()
+    for stub_test, chunk_data in product([True, False], repeat=2):
+        converter.run_conversion(
             metadata=metadata,
-            save_to_file=False,
-            conversion_options=dict(Movie=dict(module_name=module_name, module_description=module_description)),
+            nwbfile_path=nwbfile_path,
+            overwrite=True,
+            conversion_options=dict(
+                Movie=dict(external_mode=False, stub_test=stub_test, chunk_data=chunk_data, backend=movie_backend)
+            ),
         )
-        assert module_name in nwbfile.modules and nwbfile.modules[module_name].description == module_description
-        rmtree(test_dir)
+        with NWBHDF5IO(path=nwbfile_path, mode="r") as io:
+            nwbfile = io.read()
+            n_frames = 10 if stub_test else nf
+            assert nwbfile.acquisition[f"Video: {Path(movie_file).stem}"].data.shape == (n_frames, nx, ny, 3)